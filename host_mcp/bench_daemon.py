@@ -0,0 +1,149 @@
+"""
+Benchmark de latência por comando: modo de comando único vs. modo daemon.
+
+O LLM é substituído por backends locais (com latência configurável) para que o
+teste meça apenas o custo do próprio host: iniciar o interpretador, importar as bibliotecas,
+criar o cliente HTTP etc. São dois cenários:
+
+- 'UNKNOWN': o backend 'stub' responde sempre essa intenção, então nenhum
+  servidor é usado e o tempo medido é só o do host;
+- 'GET_DATETIME': o backend 'replay' devolve uma intenção real, que é atendida
+  por um servidor temporário (com banco de dados descartável), cobrindo também
+  o caminho HTTP, em que a conexão reaproveitada pelo daemon faz diferença.
+
+Uso:
+    python host_mcp/bench_daemon.py --n 50 --llm-latency 0.0
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import daemon
+from bench_pipeline import start_server
+
+HOST_DIR = Path(__file__).resolve().parent
+
+# Código executado no início de cada processo filho: carrega o host. O backend
+# de LLM é escolhido pelas variáveis de ambiente definidas em _stub_env()/_replay_env().
+BOOTSTRAP = """
+import sys
+sys.path.insert(0, {host_dir!r})
+import main_cli
+"""
+
+def _stub_env(latency: float) -> dict:
+    """Ambiente dos processos filhos: usa o backend 'stub' em vez do Gemini."""
+    return {**os.environ, "MCP_LLM_BACKEND": "stub", "MCP_LLM_LATENCY": str(latency)}
+
+def _replay_env(latency: float, command: str, response: dict, server_url: str) -> dict:
+    """
+    Ambiente dos processos filhos: usa o backend 'replay' com uma gravação que
+    traduz 'command' em 'response' e aponta o cliente HTTP para 'server_url'.
+    """
+    recording = os.path.join(tempfile.mkdtemp(), "bench_daemon.jsonl")
+    with open(recording, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"command": command, "response": response}, ensure_ascii=False) + "\n")
+    return {
+        **os.environ,
+        "MCP_LLM_BACKEND": "replay",
+        "MCP_LLM_RECORDING": recording,
+        "MCP_LLM_LATENCY": str(latency),
+        "MCP_SERVER_URL": server_url,
+    }
+
+def _summary(label: str, samples: list[float]):
+    """Imprime as estatísticas de latência (em milissegundos) de uma série."""
+    ms = sorted(s * 1000 for s in samples)
+    p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+    print(f"{label:<28} média={statistics.mean(ms):8.2f} ms  p50={statistics.median(ms):8.2f} ms  p95={p95:8.2f} ms")
+
+def bench_one_shot(n: int, env: dict, command: str) -> list[float]:
+    """Cada comando inicia um processo novo do host, como um script de shell faria."""
+    code = BOOTSTRAP.format(host_dir=str(HOST_DIR)) + "main_cli.process_command(sys.argv[1])"
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code, command], check=True, capture_output=True, env=env)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+def bench_daemon(n: int, env: dict, socket_path: str, command: str,
+                 expected_output: str | None = None) -> tuple[list[float], list[float]]:
+    """
+    Inicia o daemon uma vez e mede cada comando de duas formas: pelo cliente fino
+    invocado como processo (como um script de shell faria) e pelo cliente em processo.
+    Se 'expected_output' for informado, confere que a primeira resposta o contém,
+    para não medir por engano um caminho de erro (ex: servidor inacessível).
+    """
+    code = BOOTSTRAP.format(host_dir=str(HOST_DIR)) + "import daemon\ndaemon.serve(sys.argv[1])"
+    proc = subprocess.Popen([sys.executable, "-c", code, socket_path], stdout=subprocess.DEVNULL, env=env)
+    try:
+        # Aguarda o daemon ficar pronto.
+        deadline = time.monotonic() + 30
+        while "error" in daemon.send_request({"action": "ping"}, socket_path):
+            if time.monotonic() > deadline or proc.poll() is not None:
+                raise RuntimeError("O daemon não respondeu a tempo.")
+            time.sleep(0.05)
+
+        client_script = str(HOST_DIR / "daemon.py")
+        thin_client = []
+        if expected_output is not None:
+            output = daemon.send_command(command, socket_path).get("output", "")
+            if expected_output not in output:
+                raise RuntimeError(f"Resposta inesperada do daemon: {output!r}")
+
+        for _ in range(n):
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, client_script, "--socket", socket_path, command],
+                check=True, capture_output=True,
+            )
+            thin_client.append(time.perf_counter() - start)
+
+        in_process = []
+        for _ in range(n):
+            start = time.perf_counter()
+            daemon.send_command(command, socket_path)
+            in_process.append(time.perf_counter() - start)
+    finally:
+        daemon.send_request({"action": "shutdown"}, socket_path)
+        proc.wait(timeout=10)
+    return thin_client, in_process
+
+def _run_modes(n: int, env: dict, socket_path: str, command: str, expected_output: str | None = None):
+    """Mede o mesmo comando no modo de comando único e nos dois clientes do daemon."""
+    _summary("Comando único (processo)", bench_one_shot(n, env, command))
+    thin_client, in_process = bench_daemon(n, env, socket_path, command, expected_output)
+    _summary("Daemon (cliente processo)", thin_client)
+    _summary("Daemon (cliente em memória)", in_process)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara a latência por comando do host com e sem daemon.")
+    parser.add_argument("--n", type=int, default=30, help="Número de comandos por modo.")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Latência simulada do LLM, em segundos.")
+    args = parser.parse_args()
+
+    socket_path = os.path.join(tempfile.mkdtemp(), "bench_host.sock")
+
+    print(f"--- UNKNOWN, sem servidor: {args.n} comandos por modo, latência do LLM = {args.llm_latency * 1000:.0f} ms ---")
+    _run_modes(args.n, _stub_env(args.llm_latency), socket_path, "comando de teste")
+
+    command = "que dia é hoje?"
+    server, url = start_server()
+    try:
+        env = _replay_env(args.llm_latency, command, {"intent": "GET_DATETIME", "parameters": {}}, url)
+        print(f"\n--- GET_DATETIME, servidor temporário em {url}: {args.n} comandos por modo ---")
+        _run_modes(args.n, env, socket_path, command, expected_output="Hoje é")
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Benchmark de ponta a ponta do host, sem depender do Gemini.
+
+Executa uma sessão de comandos roteirizada passando por todo o caminho
+CLI -> local_utils_client -> servidor FastAPI, com o LLM substituído pelo
+ReplayBackend (respostas gravadas, com latência configurável). Mede a latência
+de cada comando e a vazão da sessão.
+
+Por padrão, sobe um servidor temporário com banco de dados descartável, para
+não alterar as tarefas reais do usuário.
+
+Uso:
+    python host_mcp/bench_pipeline.py --repeticoes 20
+
+    # Reproduz uma sessão gravada com MCP_LLM_BACKEND=record
+    python host_mcp/bench_pipeline.py --gravacao llm_recording.jsonl
+
+    # Contra um servidor já em execução (MCP_SERVER_URL ou http://localhost:8000).
+    # ATENÇÃO: adiciona e conclui tarefas no banco de dados desse servidor.
+    python host_mcp/bench_pipeline.py --servidor-externo
+"""
+import argparse
+import io
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import llm_processor
+import main_cli
+from llm_backends import ReplayBackend, load_recordings
+from mcp_clients import local_utils_client
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+def default_session() -> list[tuple[str, dict]]:
+    """Sessão padrão: cobre todas as ferramentas do servidor."""
+    amanha = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+    return [
+        ("amanhã preciso comprar pão",
+         {"intent": "ADD_TASK", "parameters": {"description": "comprar pão", "due_date": amanha}}),
+        ("quais são minhas tarefas pendentes?",
+         {"intent": "LIST_TASKS", "parameters": {"status": "pendente"}}),
+        ("já comprei o pão",
+         {"intent": "COMPLETE_TASK_BY_DESCRIPTION", "parameters": {"description_hint": "comprar pão"}}),
+        ("liste meus arquivos de texto",
+         {"intent": "LIST_FILES", "parameters": {"extension_filter": ".txt"}}),
+        ("que dia é hoje?",
+         {"intent": "GET_DATETIME", "parameters": {}}),
+    ]
+
+def start_server() -> tuple[subprocess.Popen, str]:
+    """
+    Sobe o servidor FastAPI em uma porta livre, usando um banco de dados temporário.
+    O controle de admissão fica desligado: o benchmark mede o custo do próprio
+    host, não esperas de Retry-After.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    env = {
+        **os.environ,
+        "MCP_DB_FILE": os.path.join(tempfile.mkdtemp(), "bench.db"),
+        "MCP_RATE_LIMITING": "0",
+    }
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server_mcp_tools.main_server:app",
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=PROJECT_ROOT, env=env,
+    )
+    url = f"http://127.0.0.1:{port}"
+
+    deadline = time.monotonic() + 30
+    while True:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                break
+        except OSError:
+            if time.monotonic() > deadline or proc.poll() is not None:
+                proc.terminate()
+                raise RuntimeError("O servidor não iniciou a tempo.")
+            time.sleep(0.1)
+    return proc, url
+
+def run_session(commands: list[str], repetitions: int) -> tuple[list[float], float]:
+    """Executa a sessão e retorna a latência de cada comando e o tempo total."""
+    samples = []
+    sink = io.StringIO()
+    session_start = time.perf_counter()
+    for _ in range(repetitions):
+        for command in commands:
+            start = time.perf_counter()
+            with redirect_stdout(sink):
+                main_cli.process_command(command)
+            samples.append(time.perf_counter() - start)
+            # Descarta a saída já impressa para não acumular memória.
+            sink.seek(0)
+            sink.truncate()
+    return samples, time.perf_counter() - session_start
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de ponta a ponta do host com LLM simulado.")
+    parser.add_argument("--gravacao", help="Arquivo JSON Lines gravado com o backend 'record'.")
+    parser.add_argument("--repeticoes", type=int, default=10, help="Quantas vezes repetir a sessão.")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Latência simulada do LLM, em segundos.")
+    parser.add_argument(
+        "--servidor-externo", action="store_true",
+        help="Usa o servidor em MCP_SERVER_URL em vez de um temporário. "
+             "ATENÇÃO: a sessão adiciona e conclui tarefas no banco de dados desse servidor.",
+    )
+    args = parser.parse_args()
+
+    if args.gravacao:
+        recordings = load_recordings(args.gravacao)
+    else:
+        recordings = dict(default_session())
+    llm_processor.set_backend(ReplayBackend(recordings, latency=args.llm_latency))
+
+    server = None
+    if not args.servidor_externo:
+        server, local_utils_client.SERVER_BASE_URL = start_server()
+
+    try:
+        samples, total = run_session(list(recordings), args.repeticoes)
+    finally:
+        if server:
+            server.terminate()
+            server.wait(timeout=10)
+
+    ms = sorted(s * 1000 for s in samples)
+    p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+    print(f"--- {len(samples)} comandos contra {local_utils_client.SERVER_BASE_URL} ---")
+    print(f"Latência por comando: média={statistics.mean(ms):.2f} ms  p50={statistics.median(ms):.2f} ms  p95={p95:.2f} ms")
+    print(f"Vazão: {len(samples) / total:.1f} comandos/s (tempo total {total:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
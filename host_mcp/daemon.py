@@ -0,0 +1,229 @@
+import argparse
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+import threading
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Diretório privado do usuário para o socket, usado quando não há $XDG_RUNTIME_DIR.
+# O uid no nome evita colisões entre usuários no /tmp compartilhado.
+_FALLBACK_SOCKET_DIR = str(Path(tempfile.gettempdir()) / f"assistente_mcp-{os.getuid()}")
+
+# Caminho padrão do socket Unix usado para a comunicação entre o cliente e o daemon.
+# Fica em um diretório acessível apenas ao próprio usuário ($XDG_RUNTIME_DIR ou
+# _FALLBACK_SOCKET_DIR). Pode ser alterado pela variável de ambiente
+# MCP_HOST_SOCKET ou pela opção --socket.
+DEFAULT_SOCKET_PATH = os.getenv(
+    "MCP_HOST_SOCKET",
+    os.path.join(os.getenv("XDG_RUNTIME_DIR") or _FALLBACK_SOCKET_DIR, "assistente_mcp_host.sock"),
+)
+
+# Tempo máximo (em segundos) que o daemon espera por um cliente lento antes de desistir.
+CLIENT_TIMEOUT = 30
+
+# --- Segurança do Socket ---
+
+def _ensure_private_dir(socket_path: str, create: bool):
+    """
+    Se o socket fica no diretório de fallback do /tmp, garante que esse diretório
+    pertence ao usuário atual e não é acessível a mais ninguém (0700). Assim outro
+    usuário não consegue criar o diretório antes e se passar pelo daemon.
+    """
+    directory = os.path.dirname(socket_path)
+    if directory != _FALLBACK_SOCKET_DIR:
+        return
+    if create:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+    try:
+        info = os.lstat(directory)
+    except FileNotFoundError:
+        return  # Nenhum daemon foi iniciado ainda; a conexão vai falhar normalmente.
+    if (not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid()
+            or stat.S_IMODE(info.st_mode) & 0o077):
+        raise PermissionError(
+            f"O diretório '{directory}' não é privado do usuário atual; recusando usá-lo para o socket."
+        )
+
+def _daemon_is_running(socket_path: str) -> bool:
+    """Indica se já há um processo atendendo no socket (responde ao 'ping')."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(2)
+            sock.connect(socket_path)
+            sock.sendall(b'{"action": "ping"}\n')
+            with sock.makefile("rb") as reader:
+                reader.readline()
+    except (ConnectionRefusedError, FileNotFoundError):
+        return False
+    except OSError:
+        # Alguém aceitou a conexão (mesmo sem responder direito): o socket está em uso.
+        return True
+    return True
+
+# --- Lado do Servidor (Daemon) ---
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+    """
+    Atende uma conexão de cliente. O protocolo é simples: cada linha recebida é um
+    objeto JSON ({"action": "command", "command": "..."}) e cada resposta é uma
+    linha JSON ({"output": "..."} ou {"error": "..."}).
+    """
+    timeout = CLIENT_TIMEOUT
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError:
+                request = None
+                reply = {"error": "Requisição inválida: esperado um objeto JSON por linha."}
+            else:
+                reply = self.server.dispatch(request)
+
+            self.wfile.write((json.dumps(reply, ensure_ascii=False) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+            if isinstance(request, dict) and request.get("action") == "shutdown":
+                # shutdown() precisa rodar fora da thread do serve_forever().
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+class HostDaemonServer(socketserver.UnixStreamServer):
+    """
+    Servidor de longa duração que mantém o host "aquecido": o modelo do Gemini,
+    a sessão HTTP do local_utils_client e quaisquer caches ficam em memória entre
+    um comando e outro.
+
+    As conexões são atendidas uma de cada vez, o que preserva a ordem dos comandos
+    e permite capturar a saída de process_command() com redirect_stdout.
+    """
+
+    def __init__(self, socket_path: str, process_command):
+        self.process_command = process_command
+        super().__init__(socket_path, _CommandHandler)
+
+    def dispatch(self, request) -> dict:
+        """Executa a ação pedida pelo cliente e monta a resposta."""
+        if not isinstance(request, dict):
+            return {"error": "Requisição inválida: esperado um objeto JSON."}
+
+        action = request.get("action", "command")
+        if action == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if action == "shutdown":
+            return {"ok": True}
+        if action != "command":
+            return {"error": f"Ação '{action}' desconhecida."}
+
+        command = request.get("command")
+        if not isinstance(command, str) or not command.strip():
+            return {"error": "Nenhum comando informado."}
+
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                self.process_command(command)
+        except Exception as e:
+            return {"output": buffer.getvalue(), "error": f"Ocorreu um erro inesperado: {e}"}
+        return {"output": buffer.getvalue()}
+
+def serve(socket_path: str = DEFAULT_SOCKET_PATH):
+    """
+    Inicia o daemon e fica atendendo comandos até receber a ação 'shutdown'
+    (ou um Ctrl+C).
+    """
+    # Importação tardia: só o daemon precisa carregar o LLM e o cliente HTTP.
+    # O cliente fino (send_command) continua leve e rápido de iniciar.
+    from main_cli import process_command
+
+    _ensure_private_dir(socket_path, create=True)
+
+    if os.path.exists(socket_path):
+        # Nunca "rouba" o socket de um daemon que ainda está rodando: ele ficaria
+        # órfão e inalcançável.
+        if _daemon_is_running(socket_path):
+            print(f"[Daemon] Já existe um daemon atendendo em: {socket_path}", file=sys.stderr)
+            sys.exit(1)
+        # Socket antigo deixado por uma execução anterior que não terminou bem.
+        os.unlink(socket_path)
+
+    # Apenas o próprio usuário pode falar com o daemon: o socket já nasce com
+    # permissão 0600, sem janela entre o bind e um chmod.
+    old_umask = os.umask(0o177)
+    try:
+        server = HostDaemonServer(socket_path, process_command)
+    finally:
+        os.umask(old_umask)
+    print(f"[Daemon] Atendendo comandos em: {socket_path} (PID {os.getpid()})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        print("[Daemon] Encerrado.")
+
+# --- Lado do Cliente (Fino) ---
+
+def send_request(request: dict, socket_path: str = DEFAULT_SOCKET_PATH) -> dict:
+    """
+    Envia uma requisição ao daemon e devolve a resposta como dicionário.
+    Se o daemon não estiver rodando, retorna um dicionário com a chave 'error'.
+    """
+    try:
+        _ensure_private_dir(socket_path, create=False)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            sock.sendall((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError as e:
+        return {"error": f"Não foi possível falar com o daemon em '{socket_path}': {e}"}
+
+    if not line:
+        return {"error": "O daemon encerrou a conexão sem responder."}
+    return json.loads(line)
+
+def send_command(command: str, socket_path: str = DEFAULT_SOCKET_PATH) -> dict:
+    """Atalho para enviar um comando em linguagem natural ao daemon."""
+    return send_request({"action": "command", "command": command}, socket_path)
+
+def main():
+    """Ponto de entrada: inicia/para o daemon ou envia um comando a ele."""
+    parser = argparse.ArgumentParser(
+        description="Modo daemon do Assistente: mantém o host carregado e recebe comandos via socket Unix."
+    )
+    parser.add_argument("command", nargs="*", help="Comando em linguagem natural a ser enviado ao daemon.")
+    parser.add_argument("--iniciar", action="store_true", help="Inicia o daemon neste terminal.")
+    parser.add_argument("--parar", action="store_true", help="Pede para o daemon em execução encerrar.")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Caminho do socket Unix.")
+    args = parser.parse_args()
+
+    if args.iniciar:
+        serve(args.socket)
+        return
+
+    if args.parar:
+        reply = send_request({"action": "shutdown"}, args.socket)
+    elif args.command:
+        reply = send_command(" ".join(args.command), args.socket)
+    else:
+        parser.error("informe um comando, --iniciar ou --parar.")
+
+    if reply.get("output"):
+        print(reply["output"], end="")
+    if reply.get("error"):
+        print(f"[Assistente] {reply['error']}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+# --- Interface Comum ---
+
+class LLMBackend(ABC):
+    """
+    Interface de um "backend" de LLM: recebe o comando do usuário e devolve o
+    dicionário com 'intent' e 'parameters' (ou com a chave 'error').
+
+    O llm_processor.get_intent_and_params() delega para o backend ativo, o que
+    permite trocar o Gemini por uma implementação local em testes e benchmarks.
+    """
+
+    @abstractmethod
+    def get_intent(self, user_command: str) -> dict:
+        """Traduz o comando do usuário em {"intent": ..., "parameters": ...}."""
+
+# --- Backends Locais (sem rede) ---
+
+class StubBackend(LLMBackend):
+    """
+    Backend simulado: devolve sempre a mesma resposta, após uma latência
+    configurável que imita o tempo de resposta do modelo.
+    """
+
+    def __init__(self, response: dict | None = None, latency: float = 0.0):
+        self.response = response or {"intent": "UNKNOWN", "parameters": {}}
+        self.latency = latency
+
+    def get_intent(self, user_command: str) -> dict:
+        if self.latency > 0:
+            time.sleep(self.latency)
+        # Devolve uma cópia para que quem chama possa alterar o resultado à vontade.
+        return json.loads(json.dumps(self.response))
+
+class ReplayBackend(StubBackend):
+    """
+    Reproduz respostas gravadas anteriormente pelo RecordingBackend.
+    Comandos que não estão na gravação recebem a resposta padrão do StubBackend.
+    """
+
+    def __init__(self, recordings: dict[str, dict], latency: float = 0.0, fallback: dict | None = None):
+        super().__init__(response=fallback, latency=latency)
+        self.recordings = recordings
+
+    @classmethod
+    def from_file(cls, path: str | Path, latency: float = 0.0, fallback: dict | None = None) -> "ReplayBackend":
+        """Carrega uma gravação no formato JSON Lines ({"command": ..., "response": ...})."""
+        return cls(load_recordings(path), latency=latency, fallback=fallback)
+
+    def get_intent(self, user_command: str) -> dict:
+        recorded = self.recordings.get(user_command)
+        if recorded is None:
+            return super().get_intent(user_command)
+        if self.latency > 0:
+            time.sleep(self.latency)
+        return json.loads(json.dumps(recorded))
+
+class RecordingBackend(LLMBackend):
+    """
+    Envolve outro backend (normalmente o Gemini) e grava cada par
+    comando -> resposta em um arquivo JSON Lines, para ser reproduzido depois.
+    Respostas com erro não são gravadas.
+    """
+
+    def __init__(self, inner: LLMBackend, path: str | Path):
+        self.inner = inner
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def get_intent(self, user_command: str) -> dict:
+        response = self.inner.get_intent(user_command)
+        if "error" not in response:
+            line = json.dumps({"command": user_command, "response": response}, ensure_ascii=False)
+            with self._lock, self.path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        return response
+
+def load_recordings(path: str | Path) -> dict[str, dict]:
+    """
+    Lê um arquivo de gravação e devolve um dicionário comando -> resposta.
+    Se o mesmo comando aparecer mais de uma vez, vale a última gravação.
+    """
+    recordings = {}
+    with Path(path).open(encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                recordings[entry["command"]] = entry["response"]
+    return recordings
+
+# --- Seleção do Backend via Variáveis de Ambiente ---
+
+def create_backend_from_env(gemini_factory) -> LLMBackend:
+    """
+    Cria o backend indicado pela variável MCP_LLM_BACKEND:
+      - 'gemini' (padrão): usa a API do Gemini.
+      - 'record': usa o Gemini e grava as respostas em MCP_LLM_RECORDING.
+      - 'replay': reproduz as respostas gravadas em MCP_LLM_RECORDING.
+      - 'stub': responde sempre 'UNKNOWN', sem acessar a rede.
+    MCP_LLM_LATENCY define a latência simulada (em segundos) de 'replay' e 'stub'.
+
+    'gemini_factory' é uma função sem argumentos que cria o backend do Gemini;
+    assim este módulo não depende da biblioteca do Google.
+    """
+    kind = os.getenv("MCP_LLM_BACKEND", "gemini").lower()
+    recording_path = os.getenv("MCP_LLM_RECORDING", "llm_recording.jsonl")
+    latency = float(os.getenv("MCP_LLM_LATENCY", "0"))
+
+    if kind == "gemini":
+        return gemini_factory()
+    if kind == "record":
+        return RecordingBackend(gemini_factory(), recording_path)
+    if kind == "replay":
+        return ReplayBackend.from_file(recording_path, latency=latency)
+    if kind == "stub":
+        return StubBackend(latency=latency)
+    raise ValueError(f"Backend de LLM '{kind}' desconhecido. Use 'gemini', 'record', 'replay' ou 'stub'.")
@@ -1,14 +1,39 @@
 import os
 import json
-import google.generativeai as genai
 from dotenv import load_dotenv
 
+from llm_backends import LLMBackend, create_backend_from_env
+
 # Carrega as variáveis de ambiente do arquivo .env para a sessão atual
 load_dotenv()
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 
-def get_intent_and_params(user_command: str) -> dict:
+@lru_cache(maxsize=None)
+def _get_model(api_key: str):
+    """
+    Configura o cliente do Gemini e cria o modelo uma única vez por chave de API.
+    Em processos de longa duração (como o daemon) o mesmo objeto é reaproveitado
+    a cada comando, evitando refazer a configuração do cliente.
+    """
+    # Importação tardia: os backends locais (stub/replay) não precisam da
+    # biblioteca do Google, que é pesada para carregar.
+    import google.generativeai as genai
+
+    genai.configure(api_key=api_key)
+
+    generation_config = {
+        "temperature": 0.2,
+        "response_mime_type": "application/json",
+    }
+
+    return genai.GenerativeModel(
+        model_name="gemini-1.5-pro-latest",
+        generation_config=generation_config
+    )
+
+def _gemini_get_intent(user_command: str) -> dict:
     """
     Usa a API do Gemini para extrair a intenção e os parâmetros de um comando de usuário.
     """
@@ -17,17 +42,7 @@ def get_intent_and_params(user_command: str) -> dict:
         return {"error": "A chave da API do Gemini não foi encontrada. Verifique o arquivo .env."}
 
     try:
-        genai.configure(api_key=api_key)
-
-        generation_config = {
-            "temperature": 0.2,
-            "response_mime_type": "application/json",
-        }
-
-        model = genai.GenerativeModel(
-            model_name="gemini-1.5-pro-latest",
-            generation_config=generation_config
-        )
+        model = _get_model(api_key)
         
         # A MÁGICA ACONTECE AQUI: informamos a data atual para o modelo
         data_de_hoje = datetime.now().strftime('%Y-%m-%d')
@@ -82,4 +97,39 @@ def get_intent_and_params(user_command: str) -> dict:
     except json.JSONDecodeError:
         return {"error": f"O modelo não retornou um JSON válido. Resposta: {response.text}"}
     except Exception as e:
-        return {"error": f"Ocorreu um erro ao chamar a API do Gemini: {e}"}
\ No newline at end of file
+        return {"error": f"Ocorreu um erro ao chamar a API do Gemini: {e}"}
+
+# --- Backends de LLM ---
+
+class GeminiBackend(LLMBackend):
+    """Backend padrão: consulta a API do Gemini."""
+
+    def get_intent(self, user_command: str) -> dict:
+        return _gemini_get_intent(user_command)
+
+# Backend ativo. É criado na primeira chamada a partir das variáveis de ambiente
+# (veja llm_backends.create_backend_from_env) ou definido com set_backend().
+_backend: LLMBackend | None = None
+
+def set_backend(backend: LLMBackend | None):
+    """Define o backend usado por get_intent_and_params(). None volta ao padrão do ambiente."""
+    global _backend
+    _backend = backend
+
+def get_backend() -> LLMBackend:
+    """Retorna o backend ativo, criando-o a partir do ambiente se necessário."""
+    global _backend
+    if _backend is None:
+        _backend = create_backend_from_env(GeminiBackend)
+    return _backend
+
+def get_intent_and_params(user_command: str) -> dict:
+    """
+    Extrai a intenção e os parâmetros de um comando de usuário usando o backend
+    de LLM ativo (o Gemini, por padrão).
+    """
+    try:
+        backend = get_backend()
+    except (ValueError, OSError) as e:
+        return {"error": f"Não foi possível iniciar o backend de LLM: {e}"}
+    return backend.get_intent(user_command)
@@ -37,10 +37,85 @@ def print_files(response):
         print(f"📄 {file_name}")
     print("---------------------------------")
 
+# --- Processamento de Comandos ---
+
+def process_command(command: str):
+    """
+    Processa um único comando do usuário: obtém a intenção do LLM, chama a
+    ferramenta apropriada no servidor e imprime a resposta.
+
+    É usada tanto pelo loop interativo quanto pelo modo de comando único e
+    pelo daemon (host_mcp/daemon.py).
+    """
+    # 1. Obter intenção e parâmetros do LLM
+    intent_data = get_intent_and_params(command)
+
+    if "error" in intent_data:
+        print(f"[Assistente] Erro no processamento do comando: {intent_data['error']}")
+        return
+
+    intent = intent_data.get("intent")
+    params = intent_data.get("parameters", {})
+    
+    print(f"🧠 (Debug: Intenção='{intent}', Parâmetros={params})") # Mensagem de debug
+
+    # 2. Roteador de Intenções: Chamar a ferramenta apropriada
+    response = None
+    if intent == "ADD_TASK":
+        response = local_utils_client.call_add_task(**params)
+        if response and response.get("success"):
+            print(f"\n[Assistente] ✅ Tarefa '{response['task']['description']}' adicionada com sucesso!")
+        else:
+            print(f"\n[Assistente] ❌ Erro ao adicionar tarefa: {response.get('message')}")
+
+    elif intent == "LIST_TASKS":
+        response = local_utils_client.call_list_tasks(**params)
+        print_tasks(response)
+
+    elif intent == "COMPLETE_TASK":
+        task_id = params.get("task_id")
+        if task_id:
+            response = local_utils_client.call_update_task_status(task_id, "concluída")
+            if response and response.get("success"):
+                print(f"\n[Assistente] ✅ Tarefa {task_id} marcada como concluída!")
+            else:
+                print(f"\n[Assistente] ❌ Erro: {response.get('message') or response.get('error')}")
+        else:
+            print("[Assistente] Por favor, especifique o ID da tarefa que deseja concluir.")
+    
+    elif intent == "COMPLETE_TASK_BY_DESCRIPTION":
+        response = local_utils_client.call_complete_task_by_description(**params)
+        if response and response.get("success"):
+            print(f"\n[Assistente] ✅ Tarefa '{response['task']['description']}' marcada como concluída!")
+        else:
+            print(f"\n[Assistente] ❌ Erro: {response.get('message') or response.get('error')}")
+
+    elif intent == "LIST_FILES":
+        response = local_utils_client.call_list_files(**params)
+        print_files(response)
+
+    elif intent == "GET_DATETIME":
+        response = local_utils_client.call_get_datetime()
+        if response and not response.get("error"):
+            print(f"\n[Assistente] 🗓️  Hoje é {response.get('data_formatada')}, {response.get('hora_formatada')}.")
+        else:
+             print(f"\n[Assistente] ❌ Erro ao obter a data: {response.get('error')}")
+
+    elif intent == "UNKNOWN":
+        print("[Assistente] Desculpe, não entendi o que você quis dizer. Tente um comando relacionado a tarefas ou arquivos.")
+
+    else:
+        print(f"[Assistente] A intenção '{intent}' não é reconhecida pelo sistema.")
+
 # --- Função Principal ---
 
 def main():
     """Loop principal da interface de linha de comando (CLI)."""
+    # Modo de comando único: 'python host_mcp/main_cli.py "listar tarefas"'
+    if len(sys.argv) > 1:
+        process_command(" ".join(sys.argv[1:]))
+        return
+
     print("--- Assistente Local de Organização e Utilitários ---")
     print("Digite seu comando ou 'sair' para terminar.")
 
@@ -51,65 +126,7 @@ def main():
                 print("[Assistente] Até logo!")
                 break
 
-            # 1. Obter intenção e parâmetros do LLM
-            intent_data = get_intent_and_params(command)
-
-            if "error" in intent_data:
-                print(f"[Assistente] Erro no processamento do comando: {intent_data['error']}")
-                continue
-
-            intent = intent_data.get("intent")
-            params = intent_data.get("parameters", {})
-            
-            print(f"🧠 (Debug: Intenção='{intent}', Parâmetros={params})") # Mensagem de debug
-
-            # 2. Roteador de Intenções: Chamar a ferramenta apropriada
-            response = None
-            if intent == "ADD_TASK":
-                response = local_utils_client.call_add_task(**params)
-                if response and response.get("success"):
-                    print(f"\n[Assistente] ✅ Tarefa '{response['task']['description']}' adicionada com sucesso!")
-                else:
-                    print(f"\n[Assistente] ❌ Erro ao adicionar tarefa: {response.get('message')}")
-
-            elif intent == "LIST_TASKS":
-                response = local_utils_client.call_list_tasks(**params)
-                print_tasks(response)
-
-            elif intent == "COMPLETE_TASK":
-                task_id = params.get("task_id")
-                if task_id:
-                    response = local_utils_client.call_update_task_status(task_id, "concluída")
-                    if response and response.get("success"):
-                        print(f"\n[Assistente] ✅ Tarefa {task_id} marcada como concluída!")
-                    else:
-                        print(f"\n[Assistente] ❌ Erro: {response.get('message') or response.get('error')}")
-                else:
-                    print("[Assistente] Por favor, especifique o ID da tarefa que deseja concluir.")
-            
-            elif intent == "COMPLETE_TASK_BY_DESCRIPTION":
-                response = local_utils_client.call_complete_task_by_description(**params)
-                if response and response.get("success"):
-                    print(f"\n[Assistente] ✅ Tarefa '{response['task']['description']}' marcada como concluída!")
-                else:
-                    print(f"\n[Assistente] ❌ Erro: {response.get('message') or response.get('error')}")
-
-            elif intent == "LIST_FILES":
-                response = local_utils_client.call_list_files(**params)
-                print_files(response)
-
-            elif intent == "GET_DATETIME":
-                response = local_utils_client.call_get_datetime()
-                if response and not response.get("error"):
-                    print(f"\n[Assistente] 🗓️  Hoje é {response.get('data_formatada')}, {response.get('hora_formatada')}.")
-                else:
-                     print(f"\n[Assistente] ❌ Erro ao obter a data: {response.get('error')}")
-
-            elif intent == "UNKNOWN":
-                print("[Assistente] Desculpe, não entendi o que você quis dizer. Tente um comando relacionado a tarefas ou arquivos.")
-
-            else:
-                print(f"[Assistente] A intenção '{intent}' não é reconhecida pelo sistema.")
+            process_command(command)
 
         except (KeyboardInterrupt, EOFError):
             print("\n[Assistente] Encerrando de forma forçada. Até logo!")
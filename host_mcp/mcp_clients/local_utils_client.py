@@ -1,13 +1,65 @@
+import os
+import time
 import requests
 import json
+from email.utils import parsedate_to_datetime
 
-# A URL base do nosso servidor. Se você rodar em outra porta, altere aqui.
-SERVER_BASE_URL = "http://localhost:8000"
+# A URL base do nosso servidor. Se você rodar em outra porta, altere aqui
+# ou defina a variável de ambiente MCP_SERVER_URL.
+SERVER_BASE_URL = os.getenv("MCP_SERVER_URL", "http://localhost:8000")
+
+# Sessão HTTP compartilhada: reaproveita as conexões TCP (keep-alive) entre as
+# chamadas, o que faz diferença quando o host roda como daemon e atende muitos comandos.
+_session = requests.Session()
+
+# Quantas vezes repetir uma requisição rejeitada por sobrecarga (429/503) e o
+# tempo máximo (em segundos) que aceitamos esperar entre uma tentativa e outra.
+MAX_RETRIES = int(os.getenv("MCP_CLIENT_MAX_RETRIES", 3))
+MAX_RETRY_WAIT = float(os.getenv("MCP_CLIENT_MAX_RETRY_WAIT", 10))
+
+# Status com que o servidor rejeita requisições no controle de admissão, antes
+# de executá-las. Por isso é seguro repeti-las, inclusive as POST.
+RETRYABLE_STATUS = {429, 503}
+
+def _retry_delay(response, attempt: int) -> float:
+    """
+    Calcula quanto esperar antes da próxima tentativa, respeitando o cabeçalho
+    Retry-After-Ms (espera exata, enviada pelo nosso servidor) ou Retry-After
+    (em segundos ou como data HTTP). Sem eles, usa backoff exponencial.
+    """
+    retry_after = response.headers.get("Retry-After")
+    retry_after_ms = response.headers.get("Retry-After-Ms")
+    delay = 0.5 * 2 ** attempt
+    if retry_after_ms:
+        try:
+            return min(max(float(retry_after_ms) / 1000, 0.0), MAX_RETRY_WAIT)
+        except ValueError:
+            pass
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                pass
+    return min(max(delay, 0.0), MAX_RETRY_WAIT)
+
+def _send(method: str, url: str, **kwargs):
+    """
+    Envia a requisição pela sessão compartilhada, repetindo-a quando o servidor
+    responde 429/503 (até MAX_RETRIES vezes). Retorna a última resposta obtida.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        response = _session.request(method, url, **kwargs)
+        if response.status_code not in RETRYABLE_STATUS or attempt == MAX_RETRIES:
+            return response
+        time.sleep(_retry_delay(response, attempt))
 
 def call_get_datetime():
     """Chama o endpoint para obter a data e hora do servidor."""
     try:
-        response = requests.get(f"{SERVER_BASE_URL}/tools/system/datetime")
+        response = _send("GET", f"{SERVER_BASE_URL}/tools/system/datetime")
         response.raise_for_status() # Lança um erro para status 4xx/5xx
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -17,7 +69,7 @@ def call_add_task(description: str, due_date: str | None = None):
     """Chama o endpoint para adicionar uma nova tarefa."""
     try:
         payload = {"description": description, "due_date": due_date}
-        response = requests.post(f"{SERVER_BASE_URL}/tools/tasks/add", json=payload)
+        response = _send("POST", f"{SERVER_BASE_URL}/tools/tasks/add", json=payload)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -30,7 +82,7 @@ def call_list_tasks(status: str | None = None):
         if status:
             params['status'] = status
         
-        response = requests.get(f"{SERVER_BASE_URL}/tools/tasks/list", params=params)
+        response = _send("GET", f"{SERVER_BASE_URL}/tools/tasks/list", params=params)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -40,7 +92,7 @@ def call_update_task_status(task_id: int, new_status: str):
     """Chama o endpoint para atualizar o status de uma tarefa."""
     try:
         payload = {"new_status": new_status}
-        response = requests.post(f"{SERVER_BASE_URL}/tools/tasks/{task_id}/update_status", json=payload)
+        response = _send("POST", f"{SERVER_BASE_URL}/tools/tasks/{task_id}/update_status", json=payload)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -55,7 +107,7 @@ def call_list_files(subfolder: str | None = None, extension_filter: str | None =
         if extension_filter:
             params['extension_filter'] = extension_filter
 
-        response = requests.get(f"{SERVER_BASE_URL}/tools/files/list_workspace", params=params)
+        response = _send("GET", f"{SERVER_BASE_URL}/tools/files/list_workspace", params=params)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -66,7 +118,7 @@ def call_complete_task_by_description(description_hint: str):
     """Chama o endpoint para completar uma tarefa por descrição."""
     try:
         payload = {"description_hint": description_hint}
-        response = requests.post(f"{SERVER_BASE_URL}/tools/tasks/complete_by_description", json=payload)
+        response = _send("POST", f"{SERVER_BASE_URL}/tools/tasks/complete_by_description", json=payload)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -0,0 +1,133 @@
+"""
+Teste de carga do servidor: com e sem o controle de admissão (rate_limiting.py).
+
+Sobe o servidor duas vezes (com MCP_RATE_LIMITING=0 e =1), cada uma com um
+banco de dados descartável, e dispara requisições concorrentes de vários
+clientes contra os endpoints de tarefas. Como o local_utils_client, cada
+cliente espera o tempo indicado em Retry-After antes de tentar de novo após uma
+rejeição. Compara a latência (p50/p99) das requisições aceitas e a quantidade
+de rejeições rápidas.
+
+Uso (a partir da raiz do projeto):
+    python -m server_mcp_tools.bench_load --clientes 64 --duracao 10
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+import requests
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+def start_server(extra_env: dict) -> tuple[subprocess.Popen, str]:
+    """Sobe o servidor em uma porta livre, com um banco de dados temporário."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    env = {**os.environ, "MCP_DB_FILE": os.path.join(tempfile.mkdtemp(), "bench_load.db"), **extra_env}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server_mcp_tools.main_server:app",
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=PROJECT_ROOT, env=env,
+    )
+    url = f"http://127.0.0.1:{port}"
+
+    deadline = time.monotonic() + 30
+    while True:
+        try:
+            requests.get(f"{url}/", timeout=0.5)
+            return proc, url
+        except requests.exceptions.RequestException:
+            if time.monotonic() > deadline or proc.poll() is not None:
+                proc.terminate()
+                raise RuntimeError("O servidor não iniciou a tempo.")
+            time.sleep(0.1)
+
+def _client_worker(url: str, client_id: int, stop_at: float, honor_retry_after: bool,
+                   results: list, lock: threading.Lock):
+    """Alterna entre adicionar e listar tarefas até o fim do teste."""
+    session = requests.Session()
+    session.headers["X-Client-Id"] = f"bench-{client_id}"
+    local = []
+    i = 0
+    while time.monotonic() < stop_at:
+        start = time.perf_counter()
+        try:
+            if i % 4 == 0:
+                response = session.post(f"{url}/tools/tasks/add", json={"description": f"carga {client_id}-{i}"}, timeout=60)
+            else:
+                response = session.get(f"{url}/tools/tasks/list", params={"status": "pendente"}, timeout=60)
+            status = response.status_code
+        except requests.exceptions.RequestException:
+            status = "erro"
+        local.append((status, time.perf_counter() - start))
+        i += 1
+        if honor_retry_after and status in (429, 503):
+            if "Retry-After-Ms" in response.headers:
+                delay = float(response.headers["Retry-After-Ms"]) / 1000
+            else:
+                delay = float(response.headers.get("Retry-After", 1))
+            time.sleep(min(delay, max(0.0, stop_at - time.monotonic())))
+    with lock:
+        results.extend(local)
+
+def run_load(url: str, clients: int, duration: float, honor_retry_after: bool = True) -> list[tuple]:
+    """Dispara 'clients' threads por 'duration' segundos e retorna (status, latência) de cada requisição."""
+    results, lock = [], threading.Lock()
+    stop_at = time.monotonic() + duration
+    threads = [
+        threading.Thread(target=_client_worker, args=(url, n, stop_at, honor_retry_after, results, lock))
+        for n in range(clients)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+def _percentile(sorted_ms: list[float], fraction: float) -> float:
+    return sorted_ms[min(len(sorted_ms) - 1, int(len(sorted_ms) * fraction))] if sorted_ms else float("nan")
+
+def report(label: str, results: list[tuple], duration: float):
+    """Imprime o resumo de uma rodada do teste de carga."""
+    statuses = Counter(status for status, _ in results)
+    accepted = sorted(latency * 1000 for status, latency in results if status == 200)
+    rejected = sorted(latency * 1000 for status, latency in results if status in (429, 503))
+
+    print(f"\n--- {label} ---")
+    print(f"Requisições: {len(results)} ({len(results) / duration:.1f}/s)  por status: {dict(statuses)}")
+    if accepted:
+        print(f"Aceitas:    p50={statistics.median(accepted):8.1f} ms  p99={_percentile(accepted, 0.99):8.1f} ms  máx={accepted[-1]:8.1f} ms")
+    if rejected:
+        print(f"Rejeitadas: p50={statistics.median(rejected):8.1f} ms  p99={_percentile(rejected, 0.99):8.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga com e sem o controle de admissão.")
+    parser.add_argument("--clientes", type=int, default=64, help="Número de clientes concorrentes.")
+    parser.add_argument("--duracao", type=float, default=10.0, help="Duração de cada rodada, em segundos.")
+    parser.add_argument("--ignorar-retry-after", action="store_true",
+                        help="Clientes repetem imediatamente após uma rejeição (simula clientes mal-comportados).")
+    args = parser.parse_args()
+
+    for label, enabled in (("Sem controle de admissão", "0"), ("Com controle de admissão", "1")):
+        # Cada thread simula um cliente diferente (X-Client-Id), o que só vale em implantações confiáveis.
+        server, url = start_server({"MCP_RATE_LIMITING": enabled, "MCP_TRUST_CLIENT_ID": "1"})
+        try:
+            results = run_load(url, args.clientes, args.duracao, not args.ignorar_retry_after)
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+        report(label, results, args.duracao)
+
+
+if __name__ == "__main__":
+    main()
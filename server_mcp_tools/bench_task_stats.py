@@ -0,0 +1,98 @@
+"""
+Benchmark das estatísticas de tarefas: lista de dicionários vs. cache colunar.
+
+Cria um banco de dados temporário com N tarefas e compara, para os dois caminhos,
+o tempo de carga, a memória ocupada (medida com tracemalloc) e o tempo de
+algumas consultas típicas do endpoint /tools/tasks/stats.
+
+Uso (a partir da raiz do projeto):
+    python -m server_mcp_tools.bench_task_stats --n 1000000
+"""
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+from .data_storage import db_manager, task_column_store
+
+def populate(n: int):
+    """Insere N tarefas com vencimentos espalhados ao longo de um ano."""
+    db_manager.initialize_db()
+    rng = random.Random(42)
+    start = date.today()
+    rows = (
+        (
+            f"tarefa {i % 5000}",
+            (start + timedelta(days=rng.randrange(365))).isoformat() if rng.random() < 0.9 else None,
+            "concluída" if rng.random() < 0.3 else "pendente",
+        )
+        for i in range(n)
+    )
+    conn = db_manager.get_db_connection()
+    conn.executemany("INSERT INTO tasks (description, due_date, status) VALUES (?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+def measure(label: str, func):
+    """Executa func() medindo o tempo e o pico de memória alocada."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<40} {elapsed * 1000:10.1f} ms   retida={current / 2**20:8.1f} MiB   pico={peak / 2**20:8.1f} MiB")
+    return result
+
+def time_query(label: str, func, repeat: int = 5):
+    """Mede o melhor tempo de várias execuções de uma consulta."""
+    best = min(_timed(func) for _ in range(repeat))
+    print(f"{label:<40} {best * 1000:10.1f} ms")
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara as estatísticas de tarefas com e sem o cache colunar.")
+    parser.add_argument("--n", type=int, default=200_000, help="Número de tarefas no banco de teste.")
+    args = parser.parse_args()
+
+    if not task_column_store.is_available():
+        raise SystemExit("O cache colunar precisa do NumPy instalado (e MCP_TASK_STATS_CACHE diferente de 0).")
+
+    db_manager.DB_FILE = Path(tempfile.mkdtemp()) / "bench_stats.db"
+    print(f"Populando {args.n} tarefas em {db_manager.DB_FILE}...")
+    populate(args.n)
+
+    today = date.today()
+    week_from = task_column_store.to_day(today.isoformat())
+    week_to = task_column_store.to_day((today + timedelta(days=6)).isoformat())
+
+    print("\n--- Carga e memória ---")
+    tasks = measure("Dicionários (get_tasks_db)", db_manager.get_tasks_db)
+    store = measure("Colunar (get_task_column_store)", db_manager.get_task_column_store)
+    print(f"{'Estimativa do cache colunar':<40} {store.memory_bytes() / 2**20:10.1f} MiB")
+
+    print("\n--- Consultas (dicionários já carregados) ---")
+    time_query("Dicionários: todas as estatísticas", lambda: task_column_store.compute_stats_from_dicts(tasks))
+    time_query("Dicionários: pendentes nesta semana", lambda: task_column_store.compute_stats_from_dicts(
+        tasks, status="pendente", due_from=week_from, due_to=week_to))
+    time_query("Dicionários: com leitura do banco", lambda: task_column_store.compute_stats_from_dicts(
+        db_manager.get_tasks_db()), repeat=1)
+
+    print("\n--- Consultas (cache colunar) ---")
+    time_query("Colunar: todas as estatísticas", lambda: store.stats())
+    time_query("Colunar: pendentes nesta semana", lambda: store.stats(
+        status="pendente", due_from=week_from, due_to=week_to))
+    time_query("Colunar: com verificação de atualização", lambda: db_manager.get_task_column_store().stats())
+
+    assert store.stats() == {**task_column_store.compute_stats_from_dicts(tasks), "engine": "colunar"}
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,15 @@
+import os
 import sqlite3
+import threading
 from pathlib import Path
 
+from . import task_column_store
+
 # Define o caminho para o nosso arquivo de banco de dados.
 # Path(__file__).parent aponta para a pasta atual (data_storage), garantindo que
 # o caminho esteja sempre correto, não importa de onde o script seja chamado.
-DB_FILE = Path(__file__).parent / "local_assistant_data.db"
+# A variável de ambiente MCP_DB_FILE permite usar outro arquivo (ex: em benchmarks).
+DB_FILE = Path(os.getenv("MCP_DB_FILE") or Path(__file__).parent / "local_assistant_data.db")
 
 def get_db_connection():
     """
@@ -38,6 +43,85 @@ def initialize_db():
     conn.close()
     print("Banco de dados pronto para uso.")
 
+# --- Cache Colunar de Tarefas (Opcional) ---
+
+# Instância única do cache, criada na primeira consulta de estatísticas.
+# Enquanto for None, as escritas não precisam notificar ninguém.
+_column_store = None
+_column_store_lock = threading.Lock()
+
+def _reload_column_store(store):
+    """
+    (Re)carrega o cache colunar com todas as tarefas do banco.
+
+    As colunas novas são montadas em um cache separado, sem segurar o lock do
+    cache em uso; só a troca final é feita com o lock. Escritas concorrentes
+    continuam sendo atendidas e são reaplicadas sobre as colunas novas.
+    """
+    store.begin_reload()
+    fresh = task_column_store.TaskColumnStore()
+    conn = get_db_connection()
+    # Tuplas simples em vez de sqlite3.Row: a carga não precisa de acesso por nome.
+    conn.row_factory = None
+    try:
+        fresh.load(conn.execute("SELECT id, description, due_date, status FROM tasks ORDER BY id"))
+    finally:
+        conn.close()
+    store.swap_in(fresh)
+
+def _sync_column_store(conn, task_id: int):
+    """
+    Copia para o cache colunar (se estiver em uso) a tarefa como ela está no banco.
+
+    Deve ser chamada depois do commit. A linha é relida com o lock do cache
+    seguro: se duas escritas na mesma tarefa chegarem aqui fora de ordem, a
+    última a gravar no cache ainda lê o valor mais recente do banco.
+    """
+    store = _column_store
+    if store is None:
+        return
+    with store.lock:
+        row = conn.execute(
+            "SELECT description, due_date, status FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+        if row:
+            store.upsert(task_id, row["description"], row["due_date"], row["status"])
+
+def get_task_column_store():
+    """
+    Retorna o cache colunar de tarefas, carregando-o do banco na primeira chamada.
+    Retorna None se o cache estiver desativado ou se o NumPy não estiver instalado.
+
+    A cada chamada, compara o maior id do banco (uma busca no índice da chave
+    primária) com o do cache e o recarrega se forem diferentes, o que detecta
+    tarefas inseridas por outro processo (outro worker do uvicorn, edições
+    diretas no banco etc.). Como não há remoção de tarefas, o maior id basta.
+    Mudanças de status feitas fora deste processo não são detectadas.
+    """
+    global _column_store
+    if not task_column_store.is_available():
+        return None
+
+    with _column_store_lock:
+        store = _column_store
+        if store is None:
+            # O cache é publicado antes da carga, para que as escritas feitas
+            # durante a carga sejam anotadas e reaplicadas em vez de se perderem.
+            store = task_column_store.TaskColumnStore()
+            store.begin_reload()
+            _column_store = store
+            _reload_column_store(store)
+            return store
+
+        conn = get_db_connection()
+        try:
+            max_id = conn.execute("SELECT max(id) FROM tasks").fetchone()[0]
+        finally:
+            conn.close()
+        if max_id != store.max_id():
+            _reload_column_store(store)
+    return store
+
 # --- Funções CRUD (Create, Read, Update, Delete) para Tarefas ---
 
 def add_task_db(description: str, due_date: str | None) -> int:
@@ -60,6 +144,9 @@ def add_task_db(description: str, due_date: str | None) -> int:
     )
     new_id = cursor.lastrowid
     conn.commit()
+
+    # Mantém o cache colunar (se estiver em uso) em dia com a nova tarefa.
+    _sync_column_store(conn, new_id)
     conn.close()
     return new_id
 
@@ -111,6 +198,8 @@ def update_task_status_db(task_id: int, new_status: str) -> dict | None:
         conn.close()
         return None # Tarefa não encontrada
 
+    _sync_column_store(conn, task_id)
+
     # Se foi alterada, busca a tarefa atualizada para retorná-la
     updated_task = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
     conn.close()
@@ -0,0 +1,271 @@
+import os
+import sys
+import threading
+from collections import Counter
+from datetime import date
+
+# O NumPy é opcional: sem ele (ou com MCP_TASK_STATS_CACHE=0) as estatísticas
+# são calculadas a partir da lista de dicionários, como no restante do servidor.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Valor usado na coluna de vencimento para tarefas sem data (ou com data inválida).
+# Os dias são guardados como "ordinais" (date.toordinal()), que começam em 1.
+NO_DUE_DATE = 0
+
+def is_available() -> bool:
+    """Indica se o cache colunar pode ser usado neste ambiente."""
+    return np is not None and os.getenv("MCP_TASK_STATS_CACHE", "1") != "0"
+
+# --- Funções Auxiliares de Datas ---
+
+def to_day(due_date: str | None) -> int:
+    """Converte uma data AAAA-MM-DD em ordinal; datas ausentes ou inválidas viram NO_DUE_DATE."""
+    if not due_date:
+        return NO_DUE_DATE
+    try:
+        return date.fromisoformat(due_date).toordinal()
+    except ValueError:
+        return NO_DUE_DATE
+
+def _week_start(day: int) -> int:
+    """Retorna o ordinal da segunda-feira da semana (o ordinal 1 é uma segunda-feira)."""
+    return day - (day - 1) % 7
+
+def _build_stats(total: int, by_status: dict, week_counts: list[tuple[int, int]], without_due_date: int, engine: str) -> dict:
+    """Monta o dicionário de resposta comum aos dois caminhos de cálculo."""
+    return {
+        "total": total,
+        "by_status": by_status,
+        "due_per_week": [
+            {"week_start": date.fromordinal(week).isoformat(), "count": count}
+            for week, count in week_counts
+        ],
+        "without_due_date": without_due_date,
+        "engine": engine,
+    }
+
+# --- Caminho Tradicional (Lista de Dicionários) ---
+
+def compute_stats_from_dicts(tasks: list[dict], status: str | None = None,
+                             due_from: int | None = None, due_to: int | None = None) -> dict:
+    """
+    Calcula as estatísticas percorrendo a lista de dicionários devolvida por
+    db_manager.get_tasks_db(). Usado quando o cache colunar não está disponível.
+    'due_from' e 'due_to' são ordinais (veja to_day) e limitam o vencimento.
+    """
+    by_status = Counter()
+    weeks = Counter()
+    total = 0
+    without_due_date = 0
+    for task in tasks:
+        if status is not None and task['status'] != status:
+            continue
+        day = to_day(task['due_date'])
+        if (due_from is not None or due_to is not None) and day == NO_DUE_DATE:
+            continue
+        if due_from is not None and day < due_from:
+            continue
+        if due_to is not None and day > due_to:
+            continue
+
+        total += 1
+        by_status[task['status']] += 1
+        if day == NO_DUE_DATE:
+            without_due_date += 1
+        else:
+            weeks[_week_start(day)] += 1
+
+    return _build_stats(total, dict(by_status), sorted(weeks.items()), without_due_date, "dicionários")
+
+# --- Cache Colunar ---
+
+class TaskColumnStore:
+    """
+    Cache de leitura das tarefas em colunas (arrays do NumPy), pensado para
+    consultas analíticas (contagens por status, vencimentos por semana) sobre
+    muitas tarefas sem criar um dicionário por linha.
+
+    - id, vencimento (ordinal) e status (código) ficam em arrays compactos;
+    - status e descrições são "internados": cada texto distinto é guardado uma
+      única vez e as colunas guardam apenas o seu código.
+
+    O cache é carregado uma vez do banco e depois mantido em dia de forma
+    incremental pelo db_manager a cada escrita (upsert()).
+    """
+
+    def __init__(self, initial_capacity: int = 1024):
+        # RLock: swap_in() reaplica as escritas pendentes com upsert(), que também usa o lock.
+        self.lock = threading.RLock()
+        self._size = 0
+        self._ids = np.empty(initial_capacity, dtype=np.int64)
+        self._due_days = np.empty(initial_capacity, dtype=np.int32)
+        self._status_codes = np.empty(initial_capacity, dtype=np.int16)
+        self._description_codes = np.empty(initial_capacity, dtype=np.int32)
+        self._statuses: list[str] = []
+        self._status_index: dict[str, int] = {}
+        self._descriptions: list[str] = []
+        self._description_index: dict[str, int] = {}
+        # Durante uma recarga, as escritas também são anotadas aqui para serem
+        # reaplicadas sobre as colunas novas (veja begin_reload/swap_in).
+        self._pending: list[tuple] | None = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    # -- Internação de Textos --
+
+    def _status_code(self, status: str) -> int:
+        code = self._status_index.get(status)
+        if code is None:
+            code = len(self._statuses)
+            self._statuses.append(status)
+            self._status_index[status] = code
+        return code
+
+    def _description_code(self, description: str) -> int:
+        code = self._description_index.get(description)
+        if code is None:
+            code = len(self._descriptions)
+            self._descriptions.append(description)
+            self._description_index[description] = code
+        return code
+
+    # -- Carga e Atualizações Incrementais --
+
+    def load(self, rows):
+        """
+        (Re)carrega o cache a partir de tuplas (id, description, due_date, status)
+        ordenadas por id, descartando o conteúdo anterior.
+        """
+        ids, due_days, status_codes, description_codes = [], [], [], []
+        with self.lock:
+            self._statuses, self._status_index = [], {}
+            self._descriptions, self._description_index = [], {}
+            for task_id, description, due_date, status in rows:
+                ids.append(task_id)
+                due_days.append(to_day(due_date))
+                status_codes.append(self._status_code(status))
+                description_codes.append(self._description_code(description))
+
+            self._ids = np.array(ids, dtype=np.int64)
+            self._due_days = np.array(due_days, dtype=np.int32)
+            self._status_codes = np.array(status_codes, dtype=np.int16)
+            self._description_codes = np.array(description_codes, dtype=np.int32)
+            self._size = len(ids)
+
+    def begin_reload(self):
+        """
+        Marca o início de uma recarga feita fora do lock: a partir daqui, cada
+        upsert() também é anotado para ser reaplicado por swap_in().
+        """
+        with self.lock:
+            self._pending = []
+
+    def swap_in(self, fresh: "TaskColumnStore"):
+        """
+        Troca as colunas deste cache pelas de 'fresh' (carregado fora do lock) e
+        reaplica, em ordem, as escritas anotadas desde begin_reload(). Assim as
+        escritas só esperam pela troca, não pela leitura do banco inteiro.
+        """
+        with self.lock:
+            pending, self._pending = self._pending or [], None
+            for name in ("_size", "_ids", "_due_days", "_status_codes", "_description_codes",
+                         "_statuses", "_status_index", "_descriptions", "_description_index"):
+                setattr(self, name, getattr(fresh, name))
+            for task in pending:
+                self.upsert(*task)
+
+    def _grow(self):
+        """Dobra a capacidade das colunas (custo amortizado constante por inserção)."""
+        capacity = max(2 * len(self._ids), 1024)
+        for name in ("_ids", "_due_days", "_status_codes", "_description_codes"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def _position(self, task_id: int) -> int:
+        """Posição em que o id está (ou deveria estar); as colunas são ordenadas por id."""
+        return int(np.searchsorted(self._ids[:self._size], task_id))
+
+    def upsert(self, task_id: int, description: str, due_date: str | None, status: str):
+        """
+        Grava a tarefa no cache: insere se o id ainda não existe, ou sobrescreve
+        os campos se já existe. O db_manager chama este método com a linha lida
+        do banco após o commit, então o valor final é sempre o último gravado.
+        """
+        with self.lock:
+            if self._pending is not None:
+                self._pending.append((task_id, description, due_date, status))
+            size = self._size
+            # Caso comum: o AUTOINCREMENT gera ids crescentes, então a tarefa vai para o fim.
+            pos = self._position(task_id) if size and task_id <= self._ids[size - 1] else size
+
+            if pos == size or self._ids[pos] != task_id:
+                if size == len(self._ids):
+                    self._grow()
+                for column in (self._ids, self._due_days, self._status_codes, self._description_codes):
+                    column[pos + 1:size + 1] = column[pos:size]
+                self._ids[pos] = task_id
+                self._size = size + 1
+            self._due_days[pos] = to_day(due_date)
+            self._status_codes[pos] = self._status_code(status)
+            self._description_codes[pos] = self._description_code(description)
+
+    def max_id(self) -> int | None:
+        """Retorna o maior id do cache (ou None se estiver vazio), para comparar com o banco."""
+        with self.lock:
+            return int(self._ids[self._size - 1]) if self._size else None
+
+    # -- Consultas --
+
+    def stats(self, status: str | None = None, due_from: int | None = None, due_to: int | None = None) -> dict:
+        """
+        Calcula as mesmas estatísticas de compute_stats_from_dicts(), mas com
+        operações vetorizadas sobre as colunas.
+        """
+        with self.lock:
+            n = self._size
+            due_days = self._due_days[:n]
+            status_codes = self._status_codes[:n]
+
+            mask = np.ones(n, dtype=bool)
+            if status is not None:
+                code = self._status_index.get(status)
+                if code is None:
+                    mask[:] = False
+                else:
+                    mask &= status_codes == code
+            if due_from is not None or due_to is not None:
+                mask &= due_days != NO_DUE_DATE
+            if due_from is not None:
+                mask &= due_days >= due_from
+            if due_to is not None:
+                mask &= due_days <= due_to
+
+            selected_days = due_days[mask]
+            status_counts = np.bincount(status_codes[mask], minlength=len(self._statuses))
+            statuses = list(self._statuses)
+
+        by_status = {statuses[code]: int(count) for code, count in enumerate(status_counts) if count}
+        has_due = selected_days != NO_DUE_DATE
+        days = selected_days[has_due].astype(np.int64)
+        weeks, counts = np.unique(days - (days - 1) % 7, return_counts=True)
+
+        return _build_stats(
+            int(selected_days.size),
+            by_status,
+            list(zip(weeks.tolist(), counts.tolist())),
+            int(selected_days.size - has_due.sum()),
+            "colunar",
+        )
+
+    def memory_bytes(self) -> int:
+        """Estimativa do espaço ocupado pelo cache (colunas + textos internados)."""
+        columns = sum(a.nbytes for a in (self._ids, self._due_days, self._status_codes, self._description_codes))
+        texts = sum(sys.getsizeof(s) for s in self._descriptions) + sum(sys.getsizeof(s) for s in self._statuses)
+        indexes = sum(sys.getsizeof(c) for c in (self._descriptions, self._description_index, self._statuses, self._status_index))
+        return columns + texts + indexes
@@ -10,12 +10,15 @@ from .tools_logic import system_info_logic, task_logic, file_system_logic
 # Importando os modelos Pydantic para validação
 from .models_pydantic import (
     AddTaskRequest, UpdateTaskStatusRequest, TaskActionResponse,
-    FileListResponse, TaskResponse
+    FileListResponse, TaskResponse, TaskStatsResponse
 )
 
 # Importando o gerenciador de banco de dados para a inicialização
 from .data_storage import db_manager
 
+# Importando o controle de admissão (limites de concorrência e de taxa)
+from . import rate_limiting
+
 # --- Configuração Inicial da Aplicação FastAPI ---
 
 app = FastAPI(
@@ -24,6 +27,10 @@ app = FastAPI(
     version="1.0.0",
 )
 
+# Controle de admissão: sob sobrecarga, rejeita rapidamente (429/503 com
+# Retry-After) em vez de enfileirar sem limite no threadpool e no SQLite.
+app.middleware("http")(rate_limiting.admission_middleware)
+
 # Define o caminho absoluto e seguro para o nosso workspace de arquivos.
 # Path(__file__).resolve().parent garante que o caminho é sempre relativo
 # à localização deste arquivo.
@@ -99,6 +106,21 @@ def list_tasks(status: str | None = Query(None, description="Filtre as tarefas p
     """
     return task_logic.handle_list_tasks(status)
 
+@app.get("/tools/tasks/stats", response_model=TaskStatsResponse, summary="Estatísticas agregadas das tarefas")
+def get_task_stats(
+    status: str | None = Query(None, description="Considera apenas tarefas com este status."),
+    due_from: str | None = Query(None, description="Vencimento a partir desta data (AAAA-MM-DD)."),
+    due_to: str | None = Query(None, description="Vencimento até esta data (AAAA-MM-DD).")
+):
+    """
+    Retorna contagens por status e vencimentos por semana. Os filtros de data
+    desconsideram tarefas sem vencimento.
+    """
+    result = task_logic.handle_get_task_stats(status, due_from, due_to)
+    if not result["success"]:
+        raise HTTPException(status_code=400, detail=result["message"])
+    return result["stats"]
+
 @app.post("/tools/tasks/{task_id}/update_status", response_model=TaskActionResponse, summary="Atualiza o status de uma tarefa")
 def update_task_status(task_id: int, request_body: UpdateTaskStatusRequest):
     """
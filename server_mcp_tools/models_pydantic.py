@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 # BaseModel é a classe base do Pydantic da qual todos os modelos herdam.
 # Field nos permite adicionar mais informações aos campos, como descrições e valores padrão.
@@ -38,6 +38,23 @@ class TaskActionResponse(BaseModel):
     message: str
     task: Optional[TaskResponse] = None # Retorna o objeto da tarefa se a ação for bem-sucedida
 
+class WeekDueCount(BaseModel):
+    """
+    Quantidade de tarefas que vencem em uma semana (iniciada na segunda-feira).
+    """
+    week_start: str
+    count: int
+
+class TaskStatsResponse(BaseModel):
+    """
+    Estatísticas agregadas das tarefas que atendem aos filtros da consulta.
+    """
+    total: int
+    by_status: Dict[str, int]
+    due_per_week: List[WeekDueCount]
+    without_due_date: int
+    engine: str = Field(..., description="Como as estatísticas foram calculadas: 'colunar' ou 'dicionários'.")
+
 # --- Modelos para a Ferramenta de Sistema de Arquivos ---
 
 class FileListResponse(BaseModel):
@@ -0,0 +1,210 @@
+import asyncio
+import ipaddress
+import math
+import os
+import time
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+# --- Configuração (via Variáveis de Ambiente) ---
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, default))
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, default))
+
+# MCP_RATE_LIMITING=0 desativa todo o controle de admissão (útil para comparação em benchmarks).
+ENABLED = os.getenv("MCP_RATE_LIMITING", "1") != "0"
+
+# Quanto tempo uma requisição pode esperar na fila do seu grupo antes de ser rejeitada.
+QUEUE_TIMEOUT = _env_float("MCP_LIMIT_QUEUE_TIMEOUT", 2.0)
+
+# Valor do cabeçalho Retry-After (em segundos) enviado quando o servidor está sobrecarregado.
+OVERLOAD_RETRY_AFTER = _env_int("MCP_LIMIT_RETRY_AFTER", 1)
+
+# Limite por cliente (token bucket): taxa sustentada e tamanho da rajada.
+CLIENT_RATE = _env_float("MCP_RATE_LIMIT_RPS", 20.0)
+CLIENT_BURST = _env_float("MCP_RATE_LIMIT_BURST", 40.0)
+
+# Requisições da própria máquina (o host do assistente, daemons, scripts locais)
+# não passam pelo limite por cliente, apenas pelos limites de concorrência.
+# MCP_RATE_LIMIT_LOOPBACK=1 passa a aplicá-lo também a elas.
+LIMIT_LOOPBACK = os.getenv("MCP_RATE_LIMIT_LOOPBACK", "0") == "1"
+
+# Por padrão o cliente é identificado pelo IP. O cabeçalho X-Client-Id pode ser
+# forjado por qualquer um, então só é aceito em implantações confiáveis (ex: benchmarks).
+TRUST_CLIENT_ID_HEADER = os.getenv("MCP_TRUST_CLIENT_ID", "0") == "1"
+
+# --- Limite de Concorrência com Fila Limitada ---
+
+class ConcurrencyLimiter:
+    """
+    Limita quantas requisições de um grupo de endpoints executam ao mesmo tempo.
+    Até 'max_queue' requisições podem esperar por uma vaga; além disso (ou se a
+    espera passar de 'timeout'), a requisição é rejeitada na hora, em vez de se
+    acumular no threadpool e no arquivo do SQLite.
+    """
+
+    def __init__(self, name: str, limit: int, max_queue: int):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self._semaphore = asyncio.Semaphore(limit)
+        self._waiting = 0
+
+    async def acquire(self, timeout: float) -> bool:
+        """Tenta obter uma vaga. Retorna False se a requisição deve ser rejeitada."""
+        if self._semaphore.locked() and self._waiting >= self.max_queue:
+            return False
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._waiting -= 1
+
+    def release(self):
+        self._semaphore.release()
+
+def _group_limiter(name: str, limit: int, max_queue: int) -> ConcurrencyLimiter:
+    """Cria o limitador de um grupo, permitindo sobrescrever os valores pelo ambiente."""
+    prefix = f"MCP_LIMIT_{name.upper()}"
+    return ConcurrencyLimiter(
+        name,
+        limit=_env_int(f"{prefix}_CONCURRENCY", limit),
+        max_queue=_env_int(f"{prefix}_QUEUE", max_queue),
+    )
+
+# Um limitador por grupo de endpoints, escolhido pelo prefixo do caminho.
+GROUP_LIMITERS = {
+    "/tools/tasks": _group_limiter("tasks", limit=4, max_queue=16),
+    "/tools/files": _group_limiter("files", limit=4, max_queue=16),
+    "/tools/system": _group_limiter("system", limit=8, max_queue=32),
+}
+
+def limiter_for_path(path: str) -> ConcurrencyLimiter | None:
+    """Retorna o limitador do grupo ao qual o caminho pertence (ou None)."""
+    for prefix, limiter in GROUP_LIMITERS.items():
+        if path.startswith(prefix):
+            return limiter
+    return None
+
+# --- Limite de Taxa por Cliente (Token Bucket) ---
+
+class TokenBucketLimiter:
+    """
+    Um "balde de fichas" por cliente: cada requisição consome uma ficha, e as
+    fichas são repostas a 'rate' por segundo, até no máximo 'burst'.
+    """
+
+    # Acima deste número de clientes, os baldes cheios (clientes inativos) são descartados.
+    MAX_TRACKED_CLIENTS = 10_000
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def try_acquire(self, client_id: str) -> float:
+        """
+        Consome uma ficha do cliente. Retorna 0 se a requisição pode seguir ou,
+        caso contrário, quantos segundos faltam para a próxima ficha.
+        """
+        now = time.monotonic()
+        tokens, last = self._buckets.get(client_id, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+
+        if tokens < 1:
+            self._buckets[client_id] = (tokens, now)
+            return (1 - tokens) / self.rate
+
+        self._buckets[client_id] = (tokens - 1, now)
+        if len(self._buckets) > self.MAX_TRACKED_CLIENTS:
+            self._prune(now)
+        return 0.0
+
+    def refund(self, client_id: str):
+        """Devolve a ficha de uma requisição que acabou não sendo atendida."""
+        bucket = self._buckets.get(client_id)
+        if bucket is not None:
+            tokens, last = bucket
+            self._buckets[client_id] = (min(self.burst, tokens + 1), last)
+
+    def _prune(self, now: float):
+        """Remove os clientes cujo balde já teria voltado a ficar cheio."""
+        self._buckets = {
+            client: (tokens, last)
+            for client, (tokens, last) in self._buckets.items()
+            if tokens + (now - last) * self.rate < self.burst
+        }
+
+CLIENT_LIMITER = TokenBucketLimiter(CLIENT_RATE, CLIENT_BURST)
+
+def client_id_for(request: Request) -> str | None:
+    """
+    Identifica o cliente pelo IP. O cabeçalho X-Client-Id só é considerado se
+    MCP_TRUST_CLIENT_ID=1. Retorna None para clientes isentos do limite por
+    cliente (loopback, a menos que MCP_RATE_LIMIT_LOOPBACK=1).
+    """
+    if TRUST_CLIENT_ID_HEADER and request.headers.get("x-client-id"):
+        return request.headers["x-client-id"]
+    host = request.client.host if request.client else "desconhecido"
+    if not LIMIT_LOOPBACK and _is_loopback(host):
+        return None
+    return host
+
+def _is_loopback(host: str) -> bool:
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return host == "localhost"
+
+# --- Middleware de Admissão ---
+
+def _reject(status_code: int, detail: str, retry_after: float) -> JSONResponse:
+    """
+    Monta a resposta de rejeição. Retry-After só aceita segundos inteiros, então
+    a espera exata também vai em Retry-After-Ms, que o local_utils_client
+    prefere: uma ficha que libera em 50 ms não vira 1 s de espera.
+    """
+    return JSONResponse(
+        status_code=status_code,
+        content={"detail": detail},
+        headers={
+            "Retry-After": str(max(1, math.ceil(retry_after))),
+            "Retry-After-Ms": str(max(1, math.ceil(retry_after * 1000))),
+        },
+    )
+
+async def admission_middleware(request: Request, call_next):
+    """
+    Middleware HTTP que aplica, nesta ordem:
+      1. o limite de taxa por cliente, exceto loopback (responde 429 Too Many Requests);
+      2. o limite de concorrência do grupo de endpoints, com fila limitada
+         (responde 503 Service Unavailable e devolve a ficha do cliente).
+    Ambas as respostas trazem o cabeçalho Retry-After.
+    """
+    limiter = limiter_for_path(request.url.path)
+    if not ENABLED or limiter is None:
+        return await call_next(request)
+
+    client_id = client_id_for(request)
+    if client_id is not None:
+        wait = CLIENT_LIMITER.try_acquire(client_id)
+        if wait > 0:
+            return _reject(429, "Limite de requisições excedido para este cliente.", wait)
+
+    if not await limiter.acquire(QUEUE_TIMEOUT):
+        # A sobrecarga não é culpa do cliente: devolve a ficha, para que quem
+        # respeita o Retry-After não acabe recebendo 429.
+        if client_id is not None:
+            CLIENT_LIMITER.refund(client_id)
+        return _reject(503, f"Servidor sobrecarregado (grupo '{limiter.name}'). Tente novamente em instantes.", OVERLOAD_RETRY_AFTER)
+    try:
+        return await call_next(request)
+    finally:
+        limiter.release()
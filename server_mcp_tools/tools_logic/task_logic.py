@@ -1,7 +1,7 @@
 # A sintaxe com '..' é uma importação relativa. Significa: "volte um diretório
 # a partir da minha localização atual (tool_logic) e, a partir de lá,
 # encontre a pasta 'data_storage' e importe o módulo 'db_manager'".
-from ..data_storage import db_manager
+from ..data_storage import db_manager, task_column_store
 
 def handle_add_task(description: str, due_date: str | None) -> dict:
     """
@@ -35,6 +35,33 @@ def handle_list_tasks(status: str | None) -> list[dict]:
     """
     return db_manager.get_tasks_db(status=status)
 
+def handle_get_task_stats(status: str | None, due_from: str | None, due_to: str | None) -> dict:
+    """
+    Lida com a lógica de negócio das estatísticas de tarefas (contagens por
+    status e vencimentos por semana), com filtros opcionais.
+
+    Usa o cache colunar do db_manager quando disponível; caso contrário,
+    calcula a partir da lista de dicionários.
+
+    Retorna:
+        Um dicionário com 'success' e, em caso de sucesso, as estatísticas em 'stats'.
+    """
+    # Valida as datas do filtro antes de consultar qualquer coisa
+    bounds = {}
+    for name, value in (("due_from", due_from), ("due_to", due_to)):
+        if value:
+            day = task_column_store.to_day(value)
+            if day == task_column_store.NO_DUE_DATE:
+                return {"success": False, "message": f"Data inválida em '{name}': '{value}'. Use o formato AAAA-MM-DD."}
+            bounds[name] = day
+
+    store = db_manager.get_task_column_store()
+    if store is not None:
+        stats = store.stats(status=status, **bounds)
+    else:
+        stats = task_column_store.compute_stats_from_dicts(db_manager.get_tasks_db(), status=status, **bounds)
+    return {"success": True, "stats": stats}
+
 def handle_update_task_status(task_id: int, new_status: str) -> dict:
     """
     Lida com a lógica de negócio para atualizar o status de uma tarefa.